@@ -22,12 +22,18 @@ from navigator_data_ingest.base.types import (
     UnsupportedContentTypeError,
     UploadResult,
 )
-from navigator_data_ingest.base.utils import determine_content_type
+from navigator_data_ingest.base.utils import determine_content_type, get_s3_path_client
 
 _LOGGER = logging.getLogger(__file__)
 
 META_KEY = "metadata"
 
+# TODO this is a hack and we should handle source urls upstream in the backend
+# Replacements applied in turn to a source url that returns a 404:
+#   mutation 1 - remove %
+#   mutation 2 - replace % with the encoded version, i.e. %25
+SOURCE_URL_MUTATIONS = (("%", ""), ("%", "%25"))
+
 
 def upload_document(
     session: requests.Session,
@@ -57,27 +63,33 @@ def upload_document(
     )
 
     try:
-        download_response = _download_from_source(session, source_url)
-        content_type = determine_content_type(download_response, source_url)
+        # The response is streamed, so it is closed on leaving this block to release
+        # its connection, including when the content type can't be determined
+        with _download_from_source(session, source_url) as download_response:
+            content_type = determine_content_type(download_response, source_url)
 
-        # Update the result object with the detected content type
-        upload_result.content_type = content_type
+            # Update the result object with the detected content type
+            upload_result.content_type = content_type
 
-        # Decide what to do next based on content type
-        if content_type in MULTI_FILE_CONTENT_TYPES:
-            raise UnsupportedContentTypeError(content_type)
+            # Decide what to do next based on content type. The body of unsupported
+            # documents is never downloaded
+            if (
+                content_type in MULTI_FILE_CONTENT_TYPES
+                or content_type not in SUPPORTED_CONTENT_TYPES
+            ):
+                raise UnsupportedContentTypeError(content_type)
 
-        if content_type not in SUPPORTED_CONTENT_TYPES:
-            raise UnsupportedContentTypeError(content_type)
+            # Ensure valid file types can be read accordingly
+            file_content = _read_source_content(session, source_url, download_response)
 
-        # Ensure valid file types can be read accordingly
-        file_content = download_response.content
         if content_type == CONTENT_TYPE_PDF:
             # Invalid pdf should raise a PyPdfError error
             PdfReader(io.BytesIO(file_content))
 
-        # Calculate the m5sum & update the result object with the calculated value
-        file_hash = hashlib.md5(file_content).hexdigest()
+        # Calculate the m5sum & update the result object with the calculated value.
+        # The hash is a content fingerprint, not a security measure, so flag it as
+        # such to stay on the OpenSSL fast path on FIPS-enabled builds
+        file_hash = hashlib.new("md5", file_content, usedforsecurity=False).hexdigest()
         upload_result.md5_sum = file_hash
 
         # ext4 used in Amazon Linux /tmp directory has a max filename length of
@@ -140,21 +152,55 @@ def upload_document(
 def _download_from_source(
     session: requests.Session, source_url: str
 ) -> requests.Response:
-    # Try the orginal source url
-    download_response = session.get(source_url, allow_redirects=True, timeout=5)
-
-    # TODO this is a hack and we should handle source urls upstream in the backend
-    if download_response.status_code == 404:
-        # mutation 1 - remove %
-        download_response = session.get(
-            source_url.replace("%", ""), allow_redirects=True, timeout=5
-        )
+    return _request_source(session, source_url)
 
-    if download_response.status_code == 404:
-        # mutation 2 - replace % with the encoded version, i.e. %25
-        download_response = session.get(
-            source_url.replace("%", "%25"), allow_redirects=True, timeout=5
-        )
+
+def _read_source_content(
+    session: requests.Session, source_url: str, download_response: requests.Response
+) -> bytes:
+    """
+    Read the body of a streamed source response.
+
+    The body is only fetched here, after the retried request for the headers, so a
+    connection dropped part way through is retried by downloading the document again.
+    """
+    try:
+        return download_response.content
+    except requests.RequestException as e:
+        _LOGGER.warning(f"Reading source document from '{source_url}' failed: {e}")
+    return _download_source_content(session, source_url)
+
+
+@retry(
+    stop=stop_after_attempt(3),
+    wait=wait_random_exponential(multiplier=1, min=1, max=10),
+)
+def _download_source_content(session: requests.Session, source_url: str) -> bytes:
+    with _request_source(session, source_url) as download_response:
+        return download_response.content
+
+
+def _request_source(session: requests.Session, source_url: str) -> requests.Response:
+    # Try the orginal source url. Only the headers are fetched here, the body is
+    # downloaded once the content type is known to be supported.
+    download_response = session.get(
+        source_url, allow_redirects=True, timeout=5, stream=True
+    )
+
+    # The mutations only alter urls containing "%", so avoid re-requesting the
+    # original url when there is nothing to mutate
+    if "%" in source_url:
+        for old, new in SOURCE_URL_MUTATIONS:
+            if download_response.status_code != 404:
+                break
+            # Release the connection held by the unread response back to the pool
+            download_response.close()
+            download_response = session.get(
+                source_url.replace(old, new),
+                allow_redirects=True,
+                timeout=5,
+                stream=True,
+            )
 
     if download_response.status_code >= 300:
         raise Exception(
@@ -174,23 +220,9 @@ def _store_document_in_cache(
     data: bytes,
 ) -> str:
     clean_name = name.lstrip("/")
-    output_file_location = S3Path(f"s3://{bucket}/navigator/{clean_name}")
-    with output_file_location.open("wb") as output_file:
-        output_file.write(data)
-    return clean_name
-
-
-@retry(
-    stop=stop_after_attempt(4),
-    wait=wait_random_exponential(multiplier=1, min=1, max=10),
-)
-def save_errors(
-    bucket: str,
-    name: str,
-    data: bytes,
-) -> str:
-    clean_name = name.lstrip("/")
-    output_file_location = S3Path(f"s3://{bucket}/{clean_name}")
+    output_file_location = S3Path(
+        f"s3://{bucket}/navigator/{clean_name}", client=get_s3_path_client()
+    )
     with output_file_location.open("wb") as output_file:
         output_file.write(data)
     return clean_name
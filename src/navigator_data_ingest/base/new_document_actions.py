@@ -1,12 +1,15 @@
 import logging
+import threading
 import traceback
-from concurrent.futures import Executor, as_completed
+from concurrent.futures import Executor
+from functools import lru_cache
 from typing import Generator, Iterable
 
 import pydantic
 import requests
 from cpr_sdk.parser_models import ParserInput
 from cpr_sdk.pipeline_general_models import BackendDocument
+from requests.adapters import HTTPAdapter
 from slugify import slugify
 
 from navigator_data_ingest.base.api_client import upload_document
@@ -14,14 +17,21 @@ from navigator_data_ingest.base.types import (
     HandleResult,
     UploadResult,
 )
+from navigator_data_ingest.base.utils import submit_bounded
 
 _LOGGER = logging.getLogger(__file__)
 
+# Per-thread storage for the requests session, as handle_new_documents may be given
+# either a thread or a process pool executor
+_WORKER_STATE = threading.local()
+_MAX_POOLED_HOSTS = 100
+
 
 def handle_new_documents(
     executor: Executor,
     source: Iterable[BackendDocument],
     document_bucket: str,
+    max_in_flight: int = 32,
 ) -> Generator[HandleResult, None, None]:
     """
     Handle all documents.
@@ -30,23 +40,21 @@ def handle_new_documents(
       - Upload doc.source_url to cloud storage & set doc.url.
       - Set doc.content_type to appropriate value.
 
+    At most max_in_flight documents are submitted to the executor at once.
+
     TODO: appropriately handle complex multi-file documents
 
     The remote filename follows the template on
     https://www.notion.so/climatepolicyradar/Document-names-on-S3-6f3cd748c96141d3b714a95b42842aeb
     """
-    tasks = {
-        executor.submit(
-            _handle_document,
-            document,
-            document_bucket,
-        ): document
-        for document in source
-    }
-
-    for future in as_completed(tasks):
+    for document, future in submit_bounded(
+        executor,
+        _handle_document,
+        _unique_documents(source),
+        document_bucket,
+        max_in_flight=max_in_flight,
+    ):
         # check result, handle errors & shut down
-        document = tasks[future]
         try:
             handle_result = future.result()
         except Exception:
@@ -60,6 +68,47 @@ def handle_new_documents(
     _LOGGER.info("Done uploading documents")
 
 
+def _get_session() -> requests.Session:
+    """
+    Get the requests session for the current worker.
+
+    The session is reused for every document handled by the same worker so that
+    connections to document hosts are pooled rather than re-established (including
+    the TLS handshake) for each document.
+    """
+    session = getattr(_WORKER_STATE, "session", None)
+    if session is None:
+        session = requests.Session()
+        # Documents come from many hosts, so keep more host connection pools alive
+        # than the default of 10 to avoid repeating TLS handshakes to evicted hosts
+        adapter = HTTPAdapter(pool_connections=_MAX_POOLED_HOSTS)
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        _WORKER_STATE.session = session
+    return session
+
+
+def _unique_documents(
+    source: Iterable[BackendDocument],
+) -> Generator[BackendDocument, None, None]:
+    """Filter out documents with an import_id that has already been seen."""
+    seen_import_ids: set[str] = set()
+    for document in source:
+        if document.import_id in seen_import_ids:
+            _LOGGER.info(
+                f"Skipping duplicate new document with ID '{document.import_id}'"
+            )
+            continue
+        seen_import_ids.add(document.import_id)
+        yield document
+
+
+@lru_cache(maxsize=8192)
+def _slugify_document_name(name: str) -> str:
+    """Slugify a document name, memoized as documents often share a name."""
+    return slugify(name)
+
+
 def _upload_document(
     session: requests.Session,
     document: BackendDocument,
@@ -72,11 +121,6 @@ def _upload_document(
     :param Document document: The document description
     :return DocumentUploadResult: Details of the document content & upload location
     """
-    doc_slug = slugify(document.name)
-    doc_geo = document.geography
-    doc_year = document.publication_ts.year
-    s3_prefix = f"{doc_geo}/{doc_year}"
-
     if not document.download_url:
         if not document.source_url:
             _LOGGER.info(
@@ -92,6 +136,11 @@ def _upload_document(
     else:
         file_download_source = document.download_url
 
+    doc_slug = _slugify_document_name(document.name)
+    doc_geo = document.geography
+    doc_year = document.publication_ts.year
+    s3_prefix = f"{doc_geo}/{doc_year}"
+
     return upload_document(
         session,
         file_download_source,
@@ -117,28 +166,22 @@ def _handle_document(
     """
     _LOGGER.info(f"Handling document: {document}")
 
-    session = requests.Session()
+    session = _get_session()
 
+    source_url_error = None
     try:
         document_source_url = (
             pydantic.AnyHttpUrl(document.source_url) if document.source_url else None
         )
-
     except pydantic.ValidationError:
         _LOGGER.exception(f"Ingesting document with ID '{document.import_id}' failed.")
-        return HandleResult(
-            error=traceback.format_exc(),
-            parser_input=ParserInput(
-                document_id=document.import_id,
-                document_slug=document.slug,
-                document_name=document.name,
-                document_description=document.description,
-                document_source_url=None,
-                document_metadata=document,
-            ),
-        )
+        document_source_url = None
+        source_url_error = traceback.format_exc()
 
-    parser_input = ParserInput(
+    # The parser input is written out even on failure, so it's built once for both.
+    # All values come from the already validated document and source url, so skip
+    # re-validating them (including the whole nested document metadata).
+    parser_input = ParserInput.model_construct(
         document_id=document.import_id,
         document_slug=document.slug,
         document_name=document.name,
@@ -147,6 +190,9 @@ def _handle_document(
         document_metadata=document,
     )
 
+    if source_url_error is not None:
+        return HandleResult(error=source_url_error, parser_input=parser_input)
+
     try:
         uploaded_document_result = _upload_document(
             session,
@@ -159,12 +205,10 @@ def _handle_document(
         _LOGGER.exception(f"Ingesting document with ID '{document.import_id}' failed")
         return HandleResult(error=traceback.format_exc(), parser_input=parser_input)
 
-    parser_input = parser_input.copy(
-        update={
-            "document_cdn_object": uploaded_document_result.cdn_object,
-            "document_content_type": uploaded_document_result.content_type,
-            "document_md5_sum": uploaded_document_result.md5_sum,
-        },
-    )
+    # ParserInput doesn't validate on assignment, so update the fields in place
+    # rather than copying the whole model (including the document metadata)
+    parser_input.document_cdn_object = uploaded_document_result.cdn_object
+    parser_input.document_content_type = uploaded_document_result.content_type
+    parser_input.document_md5_sum = uploaded_document_result.md5_sum
 
     return HandleResult(parser_input=parser_input)
@@ -1,14 +1,18 @@
 """Base definitions for data ingest"""
 from abc import ABC, abstractmethod
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
+from functools import cached_property
+from types import MappingProxyType
 from typing import (
     Callable,
     Generator,
     Optional,
+    TypedDict,
 )
 
+from cloudpathlib import S3Path
 from cpr_sdk.parser_models import ParserInput
 from cpr_sdk.pipeline_general_models import (
     CONTENT_TYPE_DOCX,
@@ -18,15 +22,24 @@ from cpr_sdk.pipeline_general_models import (
     Update,
     UpdateTypes,
 )
-from pydantic import BaseModel
 
-SINGLE_FILE_CONTENT_TYPES = {
-    CONTENT_TYPE_PDF,
-    CONTENT_TYPE_DOCX,
-}
-MULTI_FILE_CONTENT_TYPES = {CONTENT_TYPE_HTML}
+SINGLE_FILE_CONTENT_TYPES = frozenset(
+    {
+        CONTENT_TYPE_PDF,
+        CONTENT_TYPE_DOCX,
+    }
+)
+MULTI_FILE_CONTENT_TYPES = frozenset({CONTENT_TYPE_HTML})
 SUPPORTED_CONTENT_TYPES = SINGLE_FILE_CONTENT_TYPES | MULTI_FILE_CONTENT_TYPES
 
+# Cached documents at or above this size are uploaded to s3 as multipart uploads of
+# parts of the same size, smaller documents are uploaded in a single PUT
+MULTIPART_CHUNKSIZE = 50 * 1024 * 1024
+# Number of parts of a multipart upload sent to s3 concurrently
+MULTIPART_MAX_CONCURRENCY = 10
+# Maximum number of pooled connections held by the shared s3 client
+S3_MAX_POOL_CONNECTIONS = 64
+
 
 class DocumentType(str, Enum):
     """Document types supported by the backend API."""
@@ -36,21 +49,27 @@ class DocumentType(str, Enum):
     LITIGATION = "Litigation"
 
 
-CATEGORY_MAPPING = {
-    "executive": DocumentType.POLICY,
-    "legislative": DocumentType.LAW,
-    "litigation": DocumentType.LITIGATION,
-}
-FILE_EXTENSION_MAPPING = {
-    CONTENT_TYPE_PDF: ".pdf",
-    CONTENT_TYPE_HTML: ".html",
-    CONTENT_TYPE_DOCX: ".docx",
-}
+CATEGORY_MAPPING = MappingProxyType(
+    {
+        "executive": DocumentType.POLICY,
+        "legislative": DocumentType.LAW,
+        "litigation": DocumentType.LITIGATION,
+    }
+)
+FILE_EXTENSION_MAPPING = MappingProxyType(
+    {
+        CONTENT_TYPE_PDF: ".pdf",
+        CONTENT_TYPE_HTML: ".html",
+        CONTENT_TYPE_DOCX: ".docx",
+    }
+)
 # Reversed mapping to get content types from file extensions
-CONTENT_TYPE_MAPPING = {v: k for k, v in FILE_EXTENSION_MAPPING.items()}
+CONTENT_TYPE_MAPPING = MappingProxyType(
+    {v: k for k, v in FILE_EXTENSION_MAPPING.items()}
+)
 
 
-class Event(BaseModel):  # noqa: D101
+class Event(TypedDict):
     """A representation of events associated with a document."""
 
     name: str
@@ -67,7 +86,8 @@ PipelineFieldMapping = {
 }
 
 
-class UploadResult(BaseModel):
+@dataclass(slots=True)
+class UploadResult:
     """Information generated during the upload of a document used by later processes"""
 
     cdn_object: Optional[str]
@@ -75,7 +95,8 @@ class UploadResult(BaseModel):
     content_type: Optional[str]
 
 
-class HandleResult(BaseModel):
+@dataclass(slots=True)
+class HandleResult:
     """Result of handling an input file"""
 
     parser_input: ParserInput
@@ -90,7 +111,8 @@ class UnsupportedContentTypeError(Exception):
         super().__init__(f"Content type '{content_type}' is not supported for caching")
 
 
-class UpdateResult(BaseModel):
+@dataclass(slots=True)
+class UpdateResult:
     """Result of updating a document update via the ingest stage."""
 
     document_id: str
@@ -98,7 +120,7 @@ class UpdateResult(BaseModel):
     error: Optional[str] = None
 
 
-@dataclass
+@dataclass(frozen=True)
 class UpdateConfig:
     """Shared configuration for document update functions."""
 
@@ -108,6 +130,39 @@ class UpdateConfig:
     embeddings_input: str
     indexer_input: str
     archive_prefix: str
+    # Shared by every object archived in a run so that all the actions taken on a
+    # document archive under the same timestamp
+    archive_timestamp: str = field(
+        default_factory=lambda: datetime.now().strftime("%Y-%m-%d-%H-%M-%S")
+    )
+
+    # The paths are cached per config instance. The config is pickled with every task
+    # submitted to a worker process, so a worker builds them again for each document
+    # and the cache only saves rebuilding them between the actions on that document.
+    @cached_property
+    def pipeline_path(self) -> S3Path:
+        """The root of the pipeline bucket."""
+        return S3Path(f"s3://{self.pipeline_bucket}")
+
+    @cached_property
+    def parser_input_path(self) -> S3Path:
+        """The directory of parser input objects."""
+        return self.pipeline_path / self.parser_input
+
+    @cached_property
+    def embeddings_input_path(self) -> S3Path:
+        """The directory of embeddings input objects."""
+        return self.pipeline_path / self.embeddings_input
+
+    @cached_property
+    def indexer_input_path(self) -> S3Path:
+        """The directory of indexer input objects."""
+        return self.pipeline_path / self.indexer_input
+
+    @cached_property
+    def archive_path(self) -> S3Path:
+        """The directory that archived objects are moved to."""
+        return self.pipeline_path / self.archive_prefix
 
 
 class DocumentGenerator(ABC):
@@ -126,7 +181,8 @@ class DocumentGenerator(ABC):
         raise NotImplementedError("process_updated_documents() not implemented")
 
 
-class Action(BaseModel):
+@dataclass(slots=True)
+class Action:
     """Base class for associating an update with the relevant action."""
 
     update: Update
@@ -1,13 +1,20 @@
 import json
 import logging
 import os
+import re
 import traceback
-from concurrent.futures import Executor, as_completed
+from collections import defaultdict
+from concurrent.futures import Executor, ThreadPoolExecutor
 from datetime import datetime
-from typing import Generator, List, Tuple, Union
+from functools import lru_cache, partial
+from typing import Callable, Dict, Generator, Iterable, List, Pattern, Tuple, Union
 
+from botocore.exceptions import ClientError
 from cloudpathlib import S3Path
 from cpr_sdk.pipeline_general_models import Update, UpdateTypes
+from tenacity import retry, retry_if_exception
+from tenacity.stop import stop_after_attempt
+from tenacity.wait import wait_random_exponential
 
 from navigator_data_ingest.base.types import (
     Action,
@@ -15,45 +22,79 @@ from navigator_data_ingest.base.types import (
     UpdateConfig,
     UpdateResult,
 )
+from navigator_data_ingest.base.utils import get_s3_client, submit_bounded
 
 _LOGGER = logging.getLogger(__file__)
 
+_MAX_FILE_OPERATION_WORKERS = 8
+# Maximum number of keys s3 accepts in a single DeleteObjects request
+_MAX_DELETE_OBJECTS = 1000
+# Maximum size of source object s3 accepts in a single CopyObject request
+_MAX_COPY_OBJECT_SIZE = 5 * 1024**3
+
 
 # TODO: hard coding translated language will lead to issues if we have more target
 #  languages in future, this could be solved by defining target languages in the DAL.
 def get_document_files(
-    prefix_path: S3Path, document_id: str, suffix_filter: str
-) -> List[S3Path]:
+    prefix_path: S3Path, document_id: str, suffixes: Tuple[str, ...]
+) -> Generator[S3Path, None, None]:
     """Get the document files for a given document ID found in an s3 directory."""
-    return [
-        prefix_path / f"{document_id}.{suffix_filter}",
-        prefix_path / f"{document_id}_translated_en.{suffix_filter}",
-    ]
+    for suffix in suffixes:
+        yield prefix_path / f"{document_id}.{suffix}"
+        yield prefix_path / f"{document_id}_translated_en.{suffix}"
+
+
+@lru_cache(maxsize=None)
+def _get_file_operation_executor() -> ThreadPoolExecutor:
+    """
+    Get the thread pool used to perform the s3 file operations of an action.
+
+    Created lazily so that each worker process owns its own pool.
+    """
+    return ThreadPoolExecutor(max_workers=_MAX_FILE_OPERATION_WORKERS)
+
+
+# A forked worker inherits the pool object but none of its threads, so it must create
+# its own rather than submit to one that would never run its tasks
+os.register_at_fork(after_in_child=_get_file_operation_executor.cache_clear)
+
+
+def _run_file_operations(
+    operations: List[Callable[[], Union[str, None]]]
+) -> List[Union[str, None]]:
+    """
+    Run independent s3 file operations concurrently.
+
+    Errors are returned in the order the operations were given regardless of the order
+    in which they complete.
+    """
+    executor = _get_file_operation_executor()
+    futures = [executor.submit(operation) for operation in operations]
+    return [error for future in futures if (error := future.result())]
 
 
 def handle_document_updates(
     executor: Executor,
-    source: Generator[Tuple[str, List[Update]], None, None],
+    source: Iterable[Tuple[str, List[Update]]],
     update_config: UpdateConfig,
+    max_in_flight: int = 32,
 ) -> Generator[List[UpdateResult], None, None]:
     """
     Handle documents updates.
 
     For each document: Iterate through the document updates and perform the relevant
     action based upon the update type.
+
+    At most max_in_flight documents are submitted to the executor at once.
     """
-    tasks = {
-        executor.submit(
-            _update_document,
-            update,
-            update_config,
-        ): update
-        for update in source
-    }
-
-    for future in as_completed(tasks):
+    for update, future in submit_bounded(
+        executor,
+        _update_document,
+        source,
+        update_config,
+        max_in_flight=max_in_flight,
+    ):
         # check result, handle errors & shut down
-        update = tasks[future]
         try:
             handle_result = future.result()
         except Exception:
@@ -76,18 +117,19 @@ def _update_document(
 
     _LOGGER.info("Updating document.", extra={"props": {"document_id": document_id}})
     actions = [
-        Action(action=update_type_actions[UpdateTypes(update.type)], update=update)
+        Action(action=update_type_actions[update.type], update=update)
         for update in updates
     ]
-    _LOGGER.info(
-        "Identified actions for document.",
-        extra={
-            "props": {
-                "document_id": document_id,
-                "actions": str([action.action.__name__ for action in actions]),
-            }
-        },
-    )
+    if _LOGGER.isEnabledFor(logging.DEBUG):
+        _LOGGER.debug(
+            "Identified actions for document.",
+            extra={
+                "props": {
+                    "document_id": document_id,
+                    "actions": str([action.action.__name__ for action in actions]),
+                }
+            },
+        )
 
     return [
         UpdateResult(
@@ -108,19 +150,14 @@ def order_actions(actions: List[Action]) -> List[Action]:
     If the action is to parse then we only perform this action.
     """
     for action in actions:
-        if action.action == parse:
+        if action.action is parse:
             return [action]
 
-    def get_action_priority(action_name: str) -> int:
-        """Get the priority of an action."""
-        return 1 if action_name == update_dont_parse.__name__ else 0
-
-    return [
-        action
-        for action in sorted(
-            actions, key=lambda action: get_action_priority(action.action.__name__)
-        )
-    ]
+    # update_dont_parse actions go last, otherwise the given order is kept
+    first, last = [], []
+    for action in actions:
+        (last if action.action is update_dont_parse else first).append(action)
+    return first + last
 
 
 def update_dont_parse(
@@ -143,84 +180,39 @@ def update_dont_parse(
             }
         },
     )
-    errors = []
+    field = str(document_update.type.value)
+    operations = []
     for prefix_path in [
-        S3Path(
-            os.path.join(
-                "s3://", update_config.pipeline_bucket, update_config.parser_input
-            )
-        ),
-        S3Path(
-            os.path.join(
-                "s3://", update_config.pipeline_bucket, update_config.embeddings_input
-            )
-        ),
+        update_config.parser_input_path,
+        update_config.embeddings_input_path,
     ]:
         # Might be translated and non-translated json objects
-        document_files = get_document_files(
-            prefix_path, document_id, suffix_filter="json"
-        )
-        for document_file in document_files:
-            error = update_file_field(
-                document_path=document_file,
-                field=str(document_update.type.value),
-                new_value=document_update.db_value,
-                existing_value=document_update.s3_value,
-            )
-            if error:
-                errors.append(error)
-
-    timestamp = datetime.now().strftime("%Y-%m-%d-%H-%M-%S")
-
-    # Archive npy file
-    archive_npy_error = rename(
-        existing_path=S3Path(
-            os.path.join(
-                "s3://",
-                update_config.pipeline_bucket,
-                update_config.indexer_input,
-                f"{document_id}.npy",
-            )
-        ),
-        rename_path=S3Path(
-            os.path.join(
-                "s3://",
-                update_config.pipeline_bucket,
-                update_config.archive_prefix,
-                update_config.indexer_input,
-                document_id,
-                f"{timestamp}.npy",
-            )
-        ),
-    )
-    if archive_npy_error:
-        errors.append(archive_npy_error)
-
-    # Archive json file
-    archive_json_error = rename(
-        existing_path=S3Path(
-            os.path.join(
-                "s3://",
-                update_config.pipeline_bucket,
-                update_config.indexer_input,
-                f"{document_id}.json",
-            )
-        ),
-        rename_path=S3Path(
-            os.path.join(
-                "s3://",
-                update_config.pipeline_bucket,
-                update_config.archive_prefix,
-                update_config.indexer_input,
-                document_id,
-                f"{timestamp}.json",
+        for document_file in get_document_files(prefix_path, document_id, ("json",)):
+            operations.append(
+                partial(
+                    update_file_field,
+                    document_path=document_file,
+                    field=field,
+                    new_value=document_update.db_value,
+                    existing_value=document_update.s3_value,
+                )
             )
-        ),
+
+    timestamp = update_config.archive_timestamp
+    archive_path = (
+        update_config.archive_path / update_config.indexer_input / document_id
     )
-    if archive_json_error:
-        errors.append(archive_json_error)
 
-    return errors
+    # Archive npy and json files
+    renames = [
+        (
+            update_config.indexer_input_path / f"{document_id}.{suffix}",
+            archive_path / f"{timestamp}.{suffix}",
+        )
+        for suffix in ["npy", "json"]
+    ]
+
+    return _run_file_operations(operations) + rename_documents(renames)
 
 
 def parse(
@@ -242,36 +234,15 @@ def parse(
             }
         },
     )
-    errors = []
-
-    timestamp = datetime.now().strftime("%Y-%m-%d-%H-%M-%S")
-    for prefix in [
-        update_config.parser_input,
-        update_config.embeddings_input,
-        update_config.indexer_input,
-    ]:
-        prefix_path = S3Path(
-            os.path.join("s3://", update_config.pipeline_bucket, prefix)
-        )
-
-        # Might be translated and non-translated json objects
-        document_files = get_document_files(
-            prefix_path, document_id, suffix_filter="json"
-        ) + get_document_files(prefix_path, document_id, suffix_filter="npy")
-        for document_file in document_files:
-            error = rename(
-                existing_path=document_file,
-                rename_path=S3Path(
-                    f"s3://{update_config.pipeline_bucket}"
-                    f"/{update_config.archive_prefix}"
-                    f"/{prefix}/{document_id}"
-                    f"/{timestamp}{document_file.suffix} "
-                ),
-            )
-            if error:
-                errors.append(error)
-
-    return errors
+    return _archive_document(
+        document_id,
+        [
+            update_config.parser_input,
+            update_config.embeddings_input,
+            update_config.indexer_input,
+        ],
+        update_config,
+    )
 
 
 def reparse(
@@ -294,35 +265,38 @@ def reparse(
             }
         },
     )
-    errors = []
+    return _archive_document(
+        document_id,
+        [
+            update_config.embeddings_input,
+            update_config.indexer_input,
+        ],
+        update_config,
+    )
 
-    timestamp = datetime.now().strftime("%Y-%m-%d-%H-%M-%S")
-    for prefix in [
-        update_config.embeddings_input,
-        update_config.indexer_input,
-    ]:
-        prefix_path = S3Path(
-            os.path.join("s3://", update_config.pipeline_bucket, prefix)
-        )
+
+def _archive_document(
+    document_id: str, prefixes: List[str], update_config: UpdateConfig
+) -> List[Union[str, None]]:
+    """Archive the json and npy files of a document found under each prefix."""
+    timestamp = update_config.archive_timestamp
+    renames = []
+    for prefix in prefixes:
+        prefix_path = update_config.pipeline_path / prefix
+        document_archive_path = update_config.archive_path / prefix / document_id
 
         # Might be translated and non-translated json objects
-        document_files = get_document_files(
-            prefix_path, document_id, suffix_filter="json"
-        ) + get_document_files(prefix_path, document_id, suffix_filter="npy")
-        for document_file in document_files:
-            error = rename(
-                existing_path=document_file,
-                rename_path=S3Path(
-                    f"s3://{update_config.pipeline_bucket}"
-                    f"/{update_config.archive_prefix}"
-                    f"/{prefix}/{document_id}"
-                    f"/{timestamp}{document_file.suffix} "
-                ),
+        for document_file in get_document_files(
+            prefix_path, document_id, ("json", "npy")
+        ):
+            renames.append(
+                (
+                    document_file,
+                    document_archive_path / f"{timestamp}{document_file.suffix} ",
+                )
             )
-            if error:
-                errors.append(error)
 
-    return errors
+    return rename_documents(renames)
 
 
 def update_field_in_all_occurences(
@@ -343,37 +317,24 @@ def update_field_in_all_occurences(
             }
         },
     )
-    errors = []
+    field = str(document_update.type.value)
+    operations = []
     for prefix_path in [
-        S3Path(
-            os.path.join(
-                "s3://", update_config.pipeline_bucket, update_config.parser_input
-            )
-        ),
-        S3Path(
-            os.path.join(
-                "s3://", update_config.pipeline_bucket, update_config.embeddings_input
-            )
-        ),
-        S3Path(
-            os.path.join(
-                "s3://", update_config.pipeline_bucket, update_config.indexer_input
-            )
-        ),
+        update_config.parser_input_path,
+        update_config.embeddings_input_path,
+        update_config.indexer_input_path,
     ]:
-        document_files = get_document_files(
-            prefix_path, document_id, suffix_filter="json"
-        )
-        for document_file in document_files:
-            error = update_file_field(
-                document_path=document_file,
-                field=str(document_update.type.value),
-                new_value=document_update.db_value,
-                existing_value=document_update.s3_value,
+        for document_file in get_document_files(prefix_path, document_id, ("json",)):
+            operations.append(
+                partial(
+                    update_file_field,
+                    document_path=document_file,
+                    field=field,
+                    new_value=document_update.db_value,
+                    existing_value=document_update.s3_value,
+                )
             )
-            if error:
-                errors.append(error)
-    return errors
+    return _run_file_operations(operations)
 
 
 def update_file_field(
@@ -383,24 +344,101 @@ def update_file_field(
     existing_value: Union[str, datetime, dict, None],
 ) -> Union[str, None]:
     """Update the value of a field in a json object within s3 with the new value."""
-    if document_path.exists():
-        pipeline_field = PipelineFieldMapping[UpdateTypes(field)]
+    if str(new_value) == str(existing_value):
         _LOGGER.info(
-            "Updating document field.",
+            "New value matches existing value, skipping update.",
             extra={
                 "props": {
                     "document_path": str(document_path),
                     "field": field,
-                    "pipeline_field": pipeline_field,
                     "value": new_value,
-                    "existing_value": existing_value,
                 }
             },
         )
-        document = json.loads(document_path.read_text())
+        return None
 
-        try:
-            if not str(document[pipeline_field]) == str(existing_value):
+    try:
+        return _update_object_field(document_path, field, new_value, existing_value)
+    except ClientError as e:
+        if not _is_precondition_failed_error(e):
+            raise
+        _LOGGER.exception(
+            "Document kept changing whilst being updated.",
+            extra={
+                "props": {
+                    "document_path": str(document_path),
+                    "field": field,
+                }
+            },
+        )
+        return traceback.format_exc()
+
+
+def _is_precondition_failed_error(error: BaseException) -> bool:
+    """Check whether an s3 request failed because a conditional header didn't match."""
+    if not isinstance(error, ClientError):
+        return False
+    return error.response.get("Error", {}).get("Code") in {"412", "PreconditionFailed"}
+
+
+@retry(
+    retry=retry_if_exception(_is_precondition_failed_error),
+    stop=stop_after_attempt(3),
+    wait=wait_random_exponential(multiplier=0.1, max=1),
+    reraise=True,
+)
+def _update_object_field(
+    document_path: S3Path,
+    field: str,
+    new_value: Union[str, datetime, dict, None],
+    existing_value: Union[str, datetime, dict, None],
+) -> Union[str, None]:
+    """
+    Read, update and write back a field of a json object within s3.
+
+    The write only succeeds if the object is unchanged since it was read, so that a
+    concurrent writer causes a retry from the latest version rather than a lost update.
+    """
+    try:
+        response = get_s3_client().get_object(
+            Bucket=document_path.bucket, Key=document_path.key
+        )
+    except ClientError as e:
+        if not _is_missing_object_error(e):
+            raise
+        _LOGGER.info(
+            "Tried to update document but it doesn't exist.",
+            extra={
+                "props": {
+                    "document_path": str(document_path),
+                }
+            },
+        )
+        # TODO: convert to an f-string with more details when we can identify the
+        #  expected files return "NotFoundError: Expected to update document but it
+        #  doesn't exist."
+        return None
+
+    pipeline_field = _resolve_pipeline_field(field)
+    _LOGGER.info(
+        "Updating document field.",
+        extra={
+            "props": {
+                "document_path": str(document_path),
+                "field": field,
+                "pipeline_field": pipeline_field,
+                "value": new_value,
+                "existing_value": existing_value,
+            }
+        },
+    )
+    content = response["Body"].read()
+
+    if new_value is None or isinstance(new_value, str):
+        spliced = _splice_string_field(content, pipeline_field, new_value)
+        if spliced is not None:
+            content, s3_value = spliced
+            if not str(s3_value) == str(existing_value):
                 _LOGGER.info(
                     "Existing value doesn't match.",
                     extra={
@@ -410,15 +448,19 @@ def update_file_field(
                             "pipeline_field": pipeline_field,
                             "value": new_value,
                             "existing_value": existing_value,
-                            "document": document,
+                            "s3_value": s3_value,
                         }
                     },
                 )
+            _put_json_object(document_path, content, response["ETag"])
+            return None
 
-            document[pipeline_field] = new_value
-        except KeyError:
-            _LOGGER.exception(
-                "Field not found in s3 object.",
+    document = json.loads(content)
+
+    try:
+        if not str(document[pipeline_field]) == str(existing_value):
+            _LOGGER.info(
+                "Existing value doesn't match.",
                 extra={
                     "props": {
                         "document_path": str(document_path),
@@ -426,65 +468,248 @@ def update_file_field(
                         "pipeline_field": pipeline_field,
                         "value": new_value,
                         "existing_value": existing_value,
-                        "document": document,
+                        "document_size": len(content),
                     }
                 },
             )
-            return traceback.format_exc()
 
-        document_path.write_text(json.dumps(document))
-        return None
-    else:
-        _LOGGER.info(
-            "Tried to update document but it doesn't exist.",
+        document[pipeline_field] = new_value
+    except KeyError:
+        _LOGGER.exception(
+            "Field not found in s3 object.",
             extra={
                 "props": {
                     "document_path": str(document_path),
+                    "field": field,
+                    "pipeline_field": pipeline_field,
+                    "value": new_value,
+                    "existing_value": existing_value,
+                    "document_size": len(content),
                 }
             },
         )
-        # TODO: convert to an f-string with more details when we can identify the
-        #  expected files return "NotFoundError: Expected to update document but it
-        #  doesn't exist."
+        return traceback.format_exc()
+
+    _put_json_object(document_path, json.dumps(document).encode(), response["ETag"])
+    return None
+
+
+def _splice_string_field(
+    content: bytes, pipeline_field: str, new_value: Union[str, None]
+) -> Union[Tuple[bytes, Union[str, None]], None]:
+    """
+    Replace the value of a string field in a raw json object without parsing it.
+
+    Parser outputs can be megabytes of text, so the value is swapped in place rather
+    than decoding and re-encoding the whole object. This only applies when the field
+    occurs exactly once in the object, is a key of the top level object rather than
+    of a nested one, and holds a string or null. None is returned otherwise so the
+    caller falls back to parsing the object.
+
+    Returns the updated content and the value that was replaced.
+    """
+    key_pattern, field_pattern = _get_field_patterns(pipeline_field)
+    if len(key_pattern.findall(content)) != 1:
+        return None
+    match = field_pattern.search(content)
+    if match is None or _get_nesting_depth(content, match.start()) != 1:
         return None
 
+    start, end = match.span("value")
+    return (
+        content[:start] + json.dumps(new_value).encode() + content[end:],
+        json.loads(match.group("value")),
+    )
+
+
+@lru_cache(maxsize=None)
+def _get_field_patterns(pipeline_field: str) -> Tuple[Pattern[bytes], Pattern[bytes]]:
+    """Get the patterns matching a json key and the key with a string or null value."""
+    key = rb'"' + re.escape(pipeline_field.encode()) + rb'"\s*:'
+    return (
+        re.compile(key),
+        re.compile(key + rb'\s*(?P<value>"(?:[^"\\]|\\.)*"|null)'),
+    )
+
+
+# Strings are matched whole so that brackets inside them aren't counted
+_JSON_NESTING_PATTERN = re.compile(rb'"(?:[^"\\]|\\.)*"|[{}\[\]]')
+
+
+def _get_nesting_depth(content: bytes, offset: int) -> int:
+    """Get the number of objects and arrays open at an offset in raw json."""
+    depth = 0
+    for token in _JSON_NESTING_PATTERN.finditer(content, 0, offset):
+        if token.group() in (b"{", b"["):
+            depth += 1
+        elif token.group() in (b"}", b"]"):
+            depth -= 1
+    return depth
+
+
+def _put_json_object(document_path: S3Path, content: bytes, etag: str) -> None:
+    """Write a json object to s3 if it still has the given etag."""
+    get_s3_client().put_object(
+        Bucket=document_path.bucket,
+        Key=document_path.key,
+        Body=content,
+        ContentType="application/json",
+        IfMatch=etag,
+    )
+
+
+@lru_cache(maxsize=None)
+def _resolve_pipeline_field(field: str) -> str:
+    """Get the name of the field in the pipeline json objects for an update field."""
+    return PipelineFieldMapping[UpdateTypes(field)]
+
 
 def rename(existing_path: S3Path, rename_path: S3Path) -> Union[str, None]:
     """Rename the document to the new path."""
-    try:
-        if existing_path.exists():
-            existing_path.rename(rename_path)
-            _LOGGER.info(
-                "Document renamed.",
-                extra={
-                    "props": {
-                        "document_path": str(existing_path),
-                        "archive_path": str(rename_path),
-                    }
-                },
-            )
+    errors = rename_documents([(existing_path, rename_path)])
+    return errors[0] if errors else None
+
+
+def rename_documents(renames: List[Tuple[S3Path, S3Path]]) -> List[Union[str, None]]:
+    """
+    Rename documents to new paths.
+
+    The documents are copied server side concurrently and the originals then deleted
+    with one batch request per bucket. A missing document is detected from its copy
+    failing rather than with a separate existence check and is skipped.
+
+    This submits the copies to the file operation thread pool so must not be called
+    from one of its threads.
+    """
+    executor = _get_file_operation_executor()
+    futures = [
+        executor.submit(_copy_object, existing_path, rename_path)
+        for existing_path, rename_path in renames
+    ]
+
+    errors = []
+    copied = []
+    for (existing_path, rename_path), future in zip(renames, futures):
+        try:
+            future.result()
+        except ClientError as e:
+            if _is_missing_object_error(e):
+                _LOGGER.info(
+                    "Document does not exist.",
+                    extra={
+                        "props": {
+                            "document_path": str(existing_path),
+                        }
+                    },
+                )
+            else:
+                errors.append(_log_rename_error(existing_path, rename_path, str(e)))
+        except Exception as e:
+            errors.append(_log_rename_error(existing_path, rename_path, str(e)))
         else:
-            _LOGGER.info(
-                "Document does not exist.",
-                extra={
-                    "props": {
-                        "document_path": str(existing_path),
-                    }
-                },
-            )
-    except Exception as e:
-        _LOGGER.exception(
-            "Renaming document failed.",
-            extra={
-                "props": {
-                    "document_path": str(existing_path),
-                    "archive_path": str(rename_path),
-                    "error": str(e),
-                }
-            },
+            copied.append((existing_path, rename_path))
+
+    return errors + _delete_renamed_documents(copied)
+
+
+def _delete_renamed_documents(
+    renames: List[Tuple[S3Path, S3Path]]
+) -> List[Union[str, None]]:
+    """Delete the original documents once they have been copied to their new path."""
+    renames_by_bucket: Dict[str, Dict[str, Tuple[S3Path, S3Path]]] = defaultdict(dict)
+    for existing_path, rename_path in renames:
+        renames_by_bucket[existing_path.bucket][existing_path.key] = (
+            existing_path,
+            rename_path,
         )
-        return str(e)
-    return None
+
+    s3_client = get_s3_client()
+    errors = []
+    for bucket, bucket_renames in renames_by_bucket.items():
+        keys = list(bucket_renames)
+        for start in range(0, len(keys), _MAX_DELETE_OBJECTS):
+            batch = keys[start : start + _MAX_DELETE_OBJECTS]
+            try:
+                response = s3_client.delete_objects(
+                    Bucket=bucket,
+                    Delete={"Objects": [{"Key": key} for key in batch], "Quiet": True},
+                )
+            except Exception as e:
+                errors.extend(
+                    _log_rename_error(*bucket_renames[key], str(e)) for key in batch
+                )
+                continue
+
+            failed = {error["Key"]: error for error in response.get("Errors", [])}
+            for key in batch:
+                existing_path, rename_path = bucket_renames[key]
+                if key in failed:
+                    errors.append(
+                        _log_rename_error(
+                            existing_path,
+                            rename_path,
+                            f"{failed[key]['Code']}: {failed[key]['Message']}",
+                            exc_info=False,
+                        )
+                    )
+                    continue
+                _LOGGER.info(
+                    "Document renamed.",
+                    extra={
+                        "props": {
+                            "document_path": str(existing_path),
+                            "archive_path": str(rename_path),
+                        }
+                    },
+                )
+    return errors
+
+
+def _log_rename_error(
+    existing_path: S3Path, rename_path: S3Path, error: str, exc_info: bool = True
+) -> str:
+    """Log that renaming a document failed, returning the error."""
+    _LOGGER.error(
+        "Renaming document failed.",
+        exc_info=exc_info,
+        extra={
+            "props": {
+                "document_path": str(existing_path),
+                "archive_path": str(rename_path),
+                "error": error,
+            }
+        },
+    )
+    return error
+
+
+def _copy_object(existing_path: S3Path, copy_path: S3Path) -> None:
+    """
+    Copy an s3 object server side.
+
+    A single copy request is limited to source objects of up to 5GB, larger objects
+    fall back to boto3's managed copy which copies the object in parts.
+    """
+    s3_client = get_s3_client()
+    copy_source = {"Bucket": existing_path.bucket, "Key": existing_path.key}
+    try:
+        s3_client.copy_object(
+            CopySource=copy_source, Bucket=copy_path.bucket, Key=copy_path.key
+        )
+    except ClientError as e:
+        if e.response.get("Error", {}).get("Code") != "InvalidRequest":
+            raise
+        # InvalidRequest is also used for other rejections, so only fall back when the
+        # source is too large to be copied in a single request
+        source = s3_client.head_object(**copy_source)
+        if source["ContentLength"] <= _MAX_COPY_OBJECT_SIZE:
+            raise
+        s3_client.copy(copy_source, copy_path.bucket, copy_path.key)
+
+
+def _is_missing_object_error(error: ClientError) -> bool:
+    """Check whether an s3 client error was raised because the object is missing."""
+    return error.response.get("Error", {}).get("Code") in {"404", "NoSuchKey"}
 
 
 update_type_actions = {
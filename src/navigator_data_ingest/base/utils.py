@@ -1,8 +1,15 @@
-import json
 import logging
-from typing import Generator, List, Tuple, cast
-
-from cloudpathlib import CloudPath, S3Path
+import os
+from concurrent.futures import FIRST_COMPLETED, Executor, Future, wait
+from functools import lru_cache
+from itertools import islice
+from typing import Any, Callable, Generator, Iterable, List, Tuple, TypeVar, cast
+
+import botocore.session
+from boto3.s3.transfer import TransferConfig
+from botocore.client import BaseClient
+from botocore.config import Config
+from cloudpathlib import CloudPath, S3Client, S3Path
 from cpr_sdk.pipeline_general_models import (
     BackendDocument,
     PipelineUpdates,
@@ -10,10 +17,18 @@ from cpr_sdk.pipeline_general_models import (
 )
 from requests import Response
 
-from navigator_data_ingest.base.types import CONTENT_TYPE_MAPPING, DocumentGenerator
+from navigator_data_ingest.base.types import (
+    CONTENT_TYPE_MAPPING,
+    MULTIPART_CHUNKSIZE,
+    MULTIPART_MAX_CONCURRENCY,
+    S3_MAX_POOL_CONNECTIONS,
+    DocumentGenerator,
+)
 
 _LOGGER = logging.getLogger(__file__)
 
+_T = TypeVar("_T")
+
 
 class LawPolicyGenerator(DocumentGenerator):
     """
@@ -26,8 +41,9 @@ class LawPolicyGenerator(DocumentGenerator):
     def __init__(self, input_file: S3Path, output_location_path: S3Path):
         """Initialize the generator."""
         _LOGGER.info("Initializing LawPolicyGenerator")
-        json_data = read_s3_json_file(input_file)
-        self.input_data = PipelineUpdates.model_validate(json_data)
+        # Validate straight from the raw JSON so pydantic-core parses and validates
+        # the input in a single pass, without building an intermediate dict
+        self.input_data = PipelineUpdates.model_validate_json(read_s3_file(input_file))
         self.output_location_path = output_location_path
 
     def process_new_documents(self) -> Generator[BackendDocument, None, None]:
@@ -52,13 +68,66 @@ class LawPolicyGenerator(DocumentGenerator):
                 raise ValueError(f"Input data missing required key: {e}")
 
 
-def read_s3_json_file(input_file: S3Path) -> dict:
-    """Read a JSON file contents from S3."""
+def read_s3_file(input_file: S3Path) -> bytes:
+    """Read a file's contents from S3."""
     _LOGGER.info(
         "Reading input file.", extra={"props": {"input_file": str(input_file)}}
     )
-    with input_file.open("r") as input_data:
-        return json.load(input_data)
+    return input_file.read_bytes()
+
+
+@lru_cache(maxsize=None)
+def get_s3_path_client() -> S3Client:
+    """
+    Get the cloudpathlib s3 client, created once per process.
+
+    Reusing the client keeps its connections alive between requests, its pool is
+    sized for the threads used for concurrent file operations and multipart uploads.
+    """
+    botocore_session = botocore.session.get_session()
+    botocore_session.set_default_client_config(
+        Config(
+            max_pool_connections=S3_MAX_POOL_CONNECTIONS,
+            retries={"mode": "adaptive", "max_attempts": 5},
+            tcp_keepalive=True,
+        )
+    )
+    return S3Client(
+        botocore_session=botocore_session,
+        boto3_transfer_config=TransferConfig(
+            multipart_threshold=MULTIPART_CHUNKSIZE,
+            multipart_chunksize=MULTIPART_CHUNKSIZE,
+            max_concurrency=MULTIPART_MAX_CONCURRENCY,
+        ),
+    )
+
+
+def get_s3_client() -> BaseClient:
+    """
+    Get the boto3 s3 client underlying the cloudpathlib client of this process.
+
+    The client is thread safe so can be shared by all of the threads in a process.
+    """
+    return get_s3_path_client().client
+
+
+def _reset_s3_path_client() -> None:
+    """
+    Replace the s3 client inherited by a forked worker process with its own.
+
+    Pooled connections can't be shared with the parent process, so the worker creates
+    its own client on first use. If the inherited client was the default used by s3
+    paths created without a client, the worker's client takes its place.
+    """
+    inherited_client = (
+        get_s3_path_client() if get_s3_path_client.cache_info().currsize else None
+    )
+    get_s3_path_client.cache_clear()
+    if inherited_client is not None and S3Client._default_client is inherited_client:
+        get_s3_path_client().set_as_default_client()
+
+
+os.register_at_fork(after_in_child=_reset_s3_path_client)
 
 
 def parser_input_already_exists(
@@ -94,3 +163,59 @@ def determine_content_type(response: Response, source_url: str) -> str:
     file_extension_start_index = source_url.rindex(".")
     file_extension = source_url[file_extension_start_index:]
     return CONTENT_TYPE_MAPPING.get(file_extension, content_type_header)
+
+
+def submit_bounded(
+    executor: Executor,
+    fn: Callable[..., Any],
+    items: Iterable[_T],
+    *args: Any,
+    max_in_flight: int,
+) -> Generator[Tuple[_T, Future], None, None]:
+    """
+    Submit fn(item, *args) to the executor for each item, yielding completed tasks.
+
+    At most max_in_flight tasks are pending at once, further items are only taken
+    from the iterable as earlier tasks complete. This bounds memory use for large
+    sources whilst keeping the executor saturated.
+
+    Args:
+        executor (Executor): the executor to submit tasks to
+        fn (Callable): the function to call for each item
+        items (Iterable): the items to submit, consumed lazily
+        args: additional positional arguments passed to fn after the item
+        max_in_flight (int): the maximum number of pending tasks
+
+    Returns:
+        Generator[Tuple[Any, Future]]: (item, future) pairs in completion order
+
+    Raises:
+        ValueError: if max_in_flight is less than 1, as no tasks would be submitted
+    """
+    # Checked before the generator is created so that the error is raised on the call
+    # rather than silently yielding nothing when iterated
+    if max_in_flight < 1:
+        raise ValueError(f"max_in_flight must be at least 1, got {max_in_flight}")
+    return _submit_bounded(executor, fn, items, *args, max_in_flight=max_in_flight)
+
+
+def _submit_bounded(
+    executor: Executor,
+    fn: Callable[..., Any],
+    items: Iterable[_T],
+    *args: Any,
+    max_in_flight: int,
+) -> Generator[Tuple[_T, Future], None, None]:
+    items_iter = iter(items)
+    tasks = {
+        executor.submit(fn, item, *args): item
+        for item in islice(items_iter, max_in_flight)
+    }
+
+    while tasks:
+        done, _ = wait(tasks, return_when=FIRST_COMPLETED)
+        for future in done:
+            item = tasks.pop(future)
+            for next_item in islice(items_iter, 1):
+                tasks[executor.submit(fn, next_item, *args)] = next_item
+            yield item, future
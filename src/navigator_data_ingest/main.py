@@ -15,7 +15,7 @@ from navigator_data_ingest.base.api_client import (
 from navigator_data_ingest.base.new_document_actions import handle_new_documents
 from navigator_data_ingest.base.types import UpdateConfig
 from navigator_data_ingest.base.updated_document_actions import handle_document_updates
-from navigator_data_ingest.base.utils import LawPolicyGenerator
+from navigator_data_ingest.base.utils import LawPolicyGenerator, get_s3_path_client
 
 # Clear existing log handlers so we always log in structured JSON
 root_logger = logging.getLogger()
@@ -130,10 +130,12 @@ def main(
     param db_state_file_key: The s3 path for the file containing the db state
     """
 
+    # Share one pooled client between all of the s3 paths used by this process, forked
+    # workers replace it with a client of their own
+    get_s3_path_client().set_as_default_client()
+
     # Get the key of folder containing the db state file
-    input_dir_path = (
-        S3Path(os.path.join("s3://", pipeline_bucket, db_state_file_key))
-    ).parent
+    input_dir_path = S3Path(f"s3://{pipeline_bucket}/{db_state_file_key}").parent
 
     # Get the key of the updates file contain information on the new and updated
     # documents (input/${timestamp}/updates.json)
@@ -180,6 +182,7 @@ def main(
             executor,
             document_generator.process_updated_documents(),
             update_config,
+            max_in_flight=worker_count * 2,
         ):
             for result in handle_result:
                 if str(result.error) != "[]":
@@ -191,6 +194,7 @@ def main(
             executor,
             document_generator.process_new_documents(),
             document_bucket,
+            max_in_flight=worker_count * 2,
         ):
             if handle_result.error is not None:
                 errors.append(
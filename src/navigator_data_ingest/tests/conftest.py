@@ -4,6 +4,7 @@ import re
 
 import boto3
 import botocore.client
+import cloudpathlib
 import pytest
 from cpr_sdk.pipeline_general_models import Update, UpdateTypes
 from moto import mock_aws
@@ -162,6 +163,9 @@ def s3_bucket_and_region() -> dict:
 @pytest.fixture
 def test_s3_client(s3_bucket_and_region, test_s3_objects):
     with mock_aws():
+        # Objects are updated with boto3 directly, so drop any copies cloudpathlib
+        # cached locally when reading them in a previous test
+        cloudpathlib.S3Client.get_default_client().clear_cache()
         s3_client = S3Client(s3_bucket_and_region["region"])
 
         s3_client.client.create_bucket(
@@ -307,3 +311,24 @@ def pdf_bytes():
     with open(pdf_data, "rb") as b:
         contents = b.read()
     return contents
+
+
+@pytest.fixture
+def backend_document_json():
+    return {
+        "name": "An example document name.",
+        "description": "An example document description.",
+        "import_id": "TEST.executive.1.1",
+        "slug": "an_example_slug_1_1",
+        "family_import_id": "TEST.family.1.0",
+        "family_slug": "an_example_family_slug_1_0",
+        "publication_ts": "2021-12-25T00:00:00",
+        "source_url": "https://domain/path/to/document.pdf",
+        "download_url": "mock://domain/path/to/document.pdf",
+        "type": "Law",
+        "source": "CCLW",
+        "category": "Policy",
+        "geography": "TEST",
+        "languages": ["English"],
+        "metadata": {},
+    }
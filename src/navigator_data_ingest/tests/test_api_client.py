@@ -1,7 +1,13 @@
+from unittest import mock
+
 import pytest
 import requests
 
-from navigator_data_ingest.base.api_client import upload_document
+from navigator_data_ingest.base.api_client import (
+    _download_from_source,
+    _read_source_content,
+    upload_document,
+)
 
 
 @pytest.mark.unit
@@ -63,3 +69,47 @@ def test_upload_document__unreadable(
     assert result.md5_sum is None
     assert result.cdn_object is None
     assert result.content_type is None
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize(
+    ("url", "mutated_url", "want_call_count"),
+    [
+        ("mock://some%data.pdf", "mock://somedata.pdf", 2),
+        ("mock://somedata.pdf", None, 1),
+    ]
+)
+def test_download_from_source__mutations(
+    requests_mock,
+    url,
+    mutated_url,
+    want_call_count,
+):
+    session = requests.Session()
+    if mutated_url:
+        requests_mock.get(url, status_code=404)
+        requests_mock.get(mutated_url, content=b"data")
+    else:
+        requests_mock.get(url, content=b"data")
+
+    response = _download_from_source(session, url)
+
+    assert response.content == b"data"
+    assert requests_mock.call_count == want_call_count
+
+
+@pytest.mark.unit
+def test_read_source_content__interrupted(requests_mock):
+    url = "mock://somedata.pdf"
+    session = requests.Session()
+    requests_mock.get(url, content=b"data")
+
+    interrupted_response = mock.MagicMock()
+    type(interrupted_response).content = mock.PropertyMock(
+        side_effect=requests.exceptions.ChunkedEncodingError()
+    )
+
+    content = _read_source_content(session, url, interrupted_response)
+
+    assert content == b"data"
+    assert requests_mock.call_count == 1
@@ -0,0 +1,100 @@
+from concurrent.futures import ThreadPoolExecutor
+from unittest import mock
+
+import pytest
+from cpr_sdk.parser_models import ParserInput
+from cpr_sdk.pipeline_general_models import BackendDocument
+
+from navigator_data_ingest.base.new_document_actions import (
+    _get_session,
+    _handle_document,
+    handle_new_documents,
+)
+from navigator_data_ingest.base.types import HandleResult
+
+
+@pytest.mark.unit
+def test_get_session__reused_per_worker():
+    """Test a worker reuses its requests session and workers don't share sessions."""
+    session = _get_session()
+
+    assert _get_session() is session
+
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        other_session = executor.submit(_get_session).result()
+
+    assert other_session is not session
+
+
+@pytest.mark.unit
+def test_handle_document(
+    test_s3_client__cdn,
+    mock_cdn_config,
+    requests_mock,
+    pdf_bytes,
+    backend_document_json,
+):
+    """Test handling a document sets the upload details on the parser input."""
+    document = BackendDocument.model_validate(backend_document_json)
+    requests_mock.get(
+        document.download_url,
+        content=pdf_bytes,
+        headers={"content-type": "application/pdf"},
+    )
+
+    result = _handle_document(document, mock_cdn_config["bucket"])
+
+    assert result.error is None
+    assert result.parser_input.document_id == document.import_id
+    assert result.parser_input.document_content_type == "application/pdf"
+    assert result.parser_input.document_md5_sum is not None
+    assert result.parser_input.document_cdn_object.startswith("TEST/2021/")
+
+
+@pytest.mark.unit
+def test_handle_new_documents__skips_duplicates(backend_document_json):
+    """Test documents sharing an import_id are only handled once."""
+    document = BackendDocument.model_validate(backend_document_json)
+    other_document = document.model_copy(update={"import_id": "TEST.executive.2.2"})
+
+    def handle(document, document_bucket):
+        return HandleResult(
+            parser_input=ParserInput(
+                document_id=document.import_id,
+                document_name=document.name,
+                document_description=document.description,
+                document_slug=document.slug,
+                document_metadata=document,
+            )
+        )
+
+    with mock.patch(
+        "navigator_data_ingest.base.new_document_actions._handle_document",
+        side_effect=handle,
+    ) as handle_document, ThreadPoolExecutor(max_workers=2) as executor:
+        results = list(
+            handle_new_documents(
+                executor, [document, other_document, document], "test-bucket"
+            )
+        )
+
+    assert handle_document.call_count == 2
+    assert sorted(result.parser_input.document_id for result in results) == [
+        "TEST.executive.1.1",
+        "TEST.executive.2.2",
+    ]
+
+
+@pytest.mark.unit
+def test_handle_document__invalid_source_url(backend_document_json):
+    """Test an invalid source url returns an error alongside the parser input."""
+    document = BackendDocument.model_validate(
+        {**backend_document_json, "source_url": "not a url"}
+    )
+
+    result = _handle_document(document, "test-bucket")
+
+    assert result.error is not None
+    assert result.parser_input.document_id == document.import_id
+    assert result.parser_input.document_source_url is None
+    assert result.parser_input.document_cdn_object is None
@@ -1,15 +1,31 @@
 import json
+import time
+from concurrent.futures import ThreadPoolExecutor
+from unittest import mock
 
 import pytest
+from botocore.exceptions import ClientError
 from cloudpathlib import S3Path
 from cpr_sdk.pipeline_general_models import UpdateTypes
 
-from navigator_data_ingest.base.types import Action, PipelineFieldMapping
+from navigator_data_ingest.base.types import (
+    Action,
+    PipelineFieldMapping,
+    UpdateResult,
+)
+from navigator_data_ingest.base.utils import get_s3_client
 from navigator_data_ingest.base.updated_document_actions import (
+    _MAX_COPY_OBJECT_SIZE,
+    _copy_object,
+    _run_file_operations,
+    _splice_string_field,
+    handle_document_updates,
     order_actions,
     parse,
     rename,
+    rename_documents,
     update_dont_parse,
+    update_field_in_all_occurences,
     update_file_field,
     update_type_actions,
 )
@@ -36,6 +52,61 @@ def test_order_actions_function(test_updates):
         Action(action=parse, update=test_updates[0]),
     ]
 
+    actions = [
+        Action(action=update_dont_parse, update=test_updates[0]),
+        Action(action=update_field_in_all_occurences, update=test_updates[0]),
+    ]
+
+    assert order_actions(actions) == [
+        Action(action=update_field_in_all_occurences, update=test_updates[0]),
+        Action(action=update_dont_parse, update=test_updates[0]),
+    ]
+
+
+@pytest.mark.unit
+def test_handle_document_updates(test_update_config, test_updates):
+    """Test every document is updated and a failing document doesn't stop the rest."""
+    source = [(f"TEST.executive.{i}.{i}", [test_updates[1]]) for i in range(10)]
+
+    def update_document(doc_updates, update_config):
+        document_id, updates = doc_updates
+        if document_id == "TEST.executive.3.3":
+            raise ValueError("failed")
+        return [UpdateResult(document_id=document_id, update=updates[0], error="[]")]
+
+    with mock.patch(
+        "navigator_data_ingest.base.updated_document_actions._update_document",
+        side_effect=update_document,
+    ), ThreadPoolExecutor(max_workers=2) as executor:
+        results = list(
+            handle_document_updates(
+                executor, iter(source), test_update_config, max_in_flight=3
+            )
+        )
+
+    assert sorted(result[0].document_id for result in results) == sorted(
+        document_id for document_id, _ in source if document_id != "TEST.executive.3.3"
+    )
+
+
+@pytest.mark.unit
+def test_run_file_operations():
+    """Test that file operation errors are returned in the order they were given."""
+
+    def operation(error, delay):
+        time.sleep(delay)
+        return error
+
+    errors = _run_file_operations(
+        [
+            lambda: operation("first", 0.05),
+            lambda: operation(None, 0),
+            lambda: operation("third", 0),
+        ]
+    )
+
+    assert errors == ["first", "third"]
+
 
 @pytest.mark.unit
 def test_update_file_field(
@@ -63,6 +134,31 @@ def test_update_file_field(
     assert document_post_update["document_name"] == "new document name"
 
 
+@pytest.mark.unit
+@pytest.mark.parametrize(
+    "content,expected",
+    [
+        (
+            b'{"document_name": "old \\"name\\"", "pages": 1}',
+            (b'{"document_name": "new name", "pages": 1}', 'old "name"'),
+        ),
+        (b'{"document_name":null}', (b'{"document_name":"new name"}', None)),
+        (b'{"document_name": "old", "metadata": {"document_name": "other"}}', None),
+        (b'{"document_name": {"nested": "object"}}', None),
+        (b'{"document_metadata": {"document_name": "x"}, "other": 1}', None),
+        (b'[{"document_name": "x"}]', None),
+        (
+            b'{"title": "a {[ b", "document_name": "old"}',
+            (b'{"title": "a {[ b", "document_name": "new name"}', "old"),
+        ),
+        (b'{"pages": 1}', None),
+    ],
+)
+def test_splice_string_field(content, expected):
+    """Test string fields are replaced in raw json only where that is unambiguous."""
+    assert _splice_string_field(content, "document_name", "new name") == expected
+
+
 @pytest.mark.unit
 def test_rename(
     test_s3_client, test_update_config, s3_bucket_and_region, s3_document_keys
@@ -83,6 +179,112 @@ def test_rename(
     assert rename_path.exists()
 
 
+@pytest.mark.unit
+def test_rename_documents(test_s3_client, test_update_config, s3_document_keys):
+    """Test that documents are renamed with a single batch delete of the originals."""
+    bucket_uri = f"s3://{test_update_config.pipeline_bucket}"
+    renames = [
+        (S3Path(f"{bucket_uri}/{key}"), S3Path(f"{bucket_uri}/test-prefix/{key}"))
+        for key in s3_document_keys[:2]
+    ] + [
+        (
+            S3Path(f"{bucket_uri}/missing/missing-document-id.json"),
+            S3Path(f"{bucket_uri}/test-prefix/missing-document-id.json"),
+        )
+    ]
+
+    s3_client = get_s3_client()
+    with mock.patch.object(
+        s3_client, "delete_objects", wraps=s3_client.delete_objects
+    ) as delete_objects:
+        errors = rename_documents(renames)
+
+    assert errors == []
+    assert delete_objects.call_count == 1
+    for existing_path, rename_path in renames[:2]:
+        assert not existing_path.exists()
+        assert rename_path.exists()
+    assert not renames[2][1].exists()
+
+
+@pytest.mark.unit
+def test_update_file_field__concurrent_write(
+    test_s3_client, test_update_config, s3_document_id, parser_input_json
+):
+    """Test that a write rejected because the object changed is retried."""
+    document_path = S3Path(
+        f"s3://{test_update_config.pipeline_bucket}/{test_update_config.parser_input}/{s3_document_id}.json"
+    )
+    s3_client = get_s3_client()
+    put_object = s3_client.put_object
+    calls = []
+
+    def put_object_after_concurrent_write(**kwargs):
+        calls.append(kwargs)
+        if len(calls) == 1:
+            raise ClientError(
+                {"Error": {"Code": "PreconditionFailed", "Message": "Changed"}},
+                "PutObject",
+            )
+        return put_object(**kwargs)
+
+    with mock.patch.object(
+        s3_client, "put_object", side_effect=put_object_after_concurrent_write
+    ):
+        error = update_file_field(
+            document_path=document_path,
+            field="name",
+            new_value="new document name",
+            existing_value=parser_input_json["document_name"],
+        )
+
+    assert error is None
+    assert len(calls) == 2
+    assert json.loads(document_path.read_text())["document_name"] == "new document name"
+
+
+@pytest.mark.unit
+def test_update_file_field__unchanged_value(test_s3_client, test_update_config):
+    """Test that an update to the value already held doesn't touch the s3 object."""
+    document_path = S3Path(
+        f"s3://{test_update_config.pipeline_bucket}/missing/missing-document-id.json"
+    )
+
+    with mock.patch.object(get_s3_client(), "get_object") as get_object:
+        error = update_file_field(
+            document_path=document_path,
+            field="name",
+            new_value="document name",
+            existing_value="document name",
+        )
+
+    assert error is None
+    get_object.assert_not_called()
+
+
+@pytest.mark.unit
+def test_missing_document(test_s3_client, test_update_config):
+    """Test that updating or renaming a missing s3 object is a no-op."""
+    missing_path = S3Path(
+        f"s3://{test_update_config.pipeline_bucket}/missing/missing-document-id.json"
+    )
+    rename_path = S3Path(
+        f"s3://{test_update_config.pipeline_bucket}/test-prefix/test-document-id.json"
+    )
+
+    assert (
+        update_file_field(
+            document_path=missing_path,
+            field="name",
+            new_value="new document name",
+            existing_value="document name",
+        )
+        is None
+    )
+    assert rename(existing_path=missing_path, rename_path=rename_path) is None
+    assert not rename_path.exists()
+
+
 @pytest.mark.unit
 def test_update_dont_parse(
     test_s3_client, test_update_config, test_updates, s3_document_id, s3_document_keys
@@ -179,3 +381,31 @@ def test_parse(
     assert not embeddings_input_translated_doc.exists()
     assert not indexer_input_doc_json.exists()
     assert not indexer_input_doc_npy.exists()
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize(
+    "content_length,want_managed_copy",
+    [(_MAX_COPY_OBJECT_SIZE + 1, True), (_MAX_COPY_OBJECT_SIZE, False)],
+)
+def test_copy_object__invalid_request(content_length, want_managed_copy):
+    """Test only objects too large to copy in one request fall back to a managed copy."""
+    s3_client = mock.Mock()
+    s3_client.copy_object.side_effect = ClientError(
+        {"Error": {"Code": "InvalidRequest"}}, "CopyObject"
+    )
+    s3_client.head_object.return_value = {"ContentLength": content_length}
+    existing_path = S3Path("s3://bucket/existing.json")
+    copy_path = S3Path("s3://bucket/copy.json")
+
+    with mock.patch(
+        "navigator_data_ingest.base.updated_document_actions.get_s3_client",
+        return_value=s3_client,
+    ):
+        if want_managed_copy:
+            _copy_object(existing_path, copy_path)
+        else:
+            with pytest.raises(ClientError):
+                _copy_object(existing_path, copy_path)
+
+    assert s3_client.copy.called == want_managed_copy
@@ -1,8 +1,19 @@
+import json
+from concurrent.futures import ThreadPoolExecutor
+
+from cloudpathlib import S3Client, S3Path
+from moto import mock_aws
 from requests import Response
 import pytest
 
 from navigator_data_ingest.base.types import CONTENT_TYPE_HTML, CONTENT_TYPE_PDF
-from navigator_data_ingest.base.utils import determine_content_type
+from navigator_data_ingest.base.utils import (
+    LawPolicyGenerator,
+    _reset_s3_path_client,
+    determine_content_type,
+    get_s3_path_client,
+    submit_bounded,
+)
 
 
 @pytest.mark.unit
@@ -23,3 +34,91 @@ def test_determine_content_type(content_type, source_url, want):
 
     got = determine_content_type(test_response, source_url)
     assert got == want
+
+
+@pytest.mark.unit
+def test_law_policy_generator(
+    test_s3_client,
+    test_update_config,
+    s3_document_id,
+    backend_document_json,
+):
+    """Test the generator yields the new and updated documents from the input file."""
+    input_file = S3Path(
+        f"s3://{test_update_config.pipeline_bucket}/input/new_and_updated_documents.json"
+    )
+    input_file.write_text(
+        json.dumps(
+            {
+                "new_documents": [backend_document_json],
+                "updated_documents": {
+                    s3_document_id: [
+                        {"type": "name", "db_value": "NEW NAME", "s3_value": "NAME"}
+                    ]
+                },
+            }
+        )
+    )
+    output_location = S3Path(
+        f"s3://{test_update_config.pipeline_bucket}/{test_update_config.parser_input}"
+    )
+
+    generator = LawPolicyGenerator(input_file, output_location)
+
+    new_documents = list(generator.process_new_documents())
+    assert [document.import_id for document in new_documents] == [
+        backend_document_json["import_id"]
+    ]
+
+    updated_documents = list(generator.process_updated_documents())
+    assert [document_id for document_id, _ in updated_documents] == [s3_document_id]
+    assert updated_documents[0][1][0].db_value == "NEW NAME"
+
+
+@pytest.mark.unit
+def test_submit_bounded():
+    """Test all items are handled without exceeding the in flight limit."""
+    pulled = []
+
+    def items():
+        for item in range(20):
+            pulled.append(item)
+            yield item
+
+    results = {}
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        for item, future in submit_bounded(
+            executor, lambda item, offset: item * 2 + offset, items(), 1, max_in_flight=2
+        ):
+            # Besides the item being yielded, pulled items are either already
+            # yielded or still in flight
+            assert len(pulled) - len(results) - 1 <= 2
+            results[item] = future.result()
+
+    assert results == {item: item * 2 + 1 for item in range(20)}
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("max_in_flight", [0, -1])
+def test_submit_bounded__invalid_max_in_flight(max_in_flight):
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        with pytest.raises(ValueError):
+            submit_bounded(executor, str, range(5), max_in_flight=max_in_flight)
+
+
+@pytest.mark.unit
+def test_reset_s3_path_client():
+    """Test a forked worker replaces an inherited default client with its own."""
+    default_client = S3Client._default_client
+    try:
+        with mock_aws():
+            inherited_client = get_s3_path_client()
+            inherited_client.set_as_default_client()
+
+            _reset_s3_path_client()
+
+            assert get_s3_path_client() is not inherited_client
+            assert S3Client.get_default_client() is get_s3_path_client()
+    finally:
+        get_s3_path_client.cache_clear()
+        S3Client._default_client = default_client